@@ -2,21 +2,39 @@
 `timescale 1ns / 1ps
 
 /* This testbench just instantiates the module and makes some convenient wires
-   that can be driven / tested by the cocotb test.py.
+   that can be driven / tested by the cocotb test modules.
 */
 module tb ();
 
   // Dump the signals to a VCD file. You can view it with gtkwave or surfer.
+`ifndef TB_NO_VCD
   initial begin
     $dumpfile("tb.vcd");
     $dumpvars(0, tb);
     #1;
   end
+`endif
 
   // Wire up the inputs and outputs:
   reg clk;
   reg rst_n;
-  always #5 clk = ~clk;
+
+  // Clock generated in HDL (default 50 ns / 20 MHz, +CLOCK_PERIOD=<ns>), so
+  // no cocotb Clock coroutine has to wake up on every edge. +NO_HDL_CLOCK
+  // (COCOTB_HDL_CLOCK=0) leaves clk to the Python Clock started by
+  // start_clock() in tb_utils.py. The half period is real so an odd period
+  // (e.g. 25 ns) keeps its exact length instead of rounding down:
+  integer clk_period;
+  real    clk_half_period;
+
+  initial begin
+    clk = 1'b0;
+    if (!$value$plusargs("CLOCK_PERIOD=%d", clk_period))
+      clk_period = 50;
+    clk_half_period = clk_period / 2.0;
+    if (!$test$plusargs("NO_HDL_CLOCK"))
+      forever #(clk_half_period) clk = ~clk;
+  end
 
   reg ena;
   reg [7:0] ui_in;
@@ -29,20 +47,91 @@ module tb ();
   supply1 VPWR, VPB;
   supply0 VGND, VNB;
 
+  // Named views of the single-bit status outputs the tests look at, so
+  // cocotb can read or wait on one bit instead of slicing a whole port:
+  wire uart_valid = uo_out[1];  // UART receiver valid
+  wire tx_busy    = uo_out[4];  // UART transmitter busy
+
+  // One-cycle strobe aligned to the DUT transmitter: held in reset while
+  // tx_busy (uo_out[4]) is low, so it pulses on the last cycle of every TX
+  // bit and the frame capture waits one trigger per bit instead of per clock:
+  wire tx_bit_strobe;
+
+  tb_clkdiv #(.N(8)) tx_bit_clkdiv (
+      .clk       (clk),
+      .rst_n     (rst_n & tx_busy),
+      .bit_strobe(tx_bit_strobe)
+  );
+
+  // Whole-frame UART driver: cocotb loads tb_load_data and pulses tb_load,
+  // then waits for tb_frame_done. While busy it drives the DUT RX pin ui_in[0]:
+  reg         tb_load;
+  reg  [15:0] tb_load_data;
+  wire        tb_uart_tx;
+  wire        tb_uart_busy;
+  wire        tb_frame_done;
+
   initial begin
-    clk = 1'b0;
-    rst_n = 1'b0;
-    ena = 1'b1;
-    ui_in = 8'hFF;
-    uio_in = 8'h00;
-    repeat (16) @(posedge clk);
-    rst_n = 1'b1;
-    repeat (16) @(posedge clk);
+    tb_load = 1'b0;
+    tb_load_data = 16'hFFFF;
   end
 
+  tb_uart_driver #(.N(8)) uart_driver (
+      .clk       (clk),
+      .rst_n     (rst_n),
+      .load      (tb_load),
+      .load_data (tb_load_data),
+      .tx        (tb_uart_tx),
+      .busy      (tb_uart_busy),
+      .frame_done(tb_frame_done)
+  );
+
+  // Transmitter case sequencer: every write that toggles tb_seq_go pulses
+  // ui_in[4] for one cycle as soon as the transmitter is idle, so a cocotb
+  // case needs neither a reset nor a clock wait to start a frame:
+  reg  tb_seq_go;
+  wire seq_start;
+
+  initial tb_seq_go = 1'b0;
+
+  tb_seq seq (
+      .clk    (clk),
+      .rst_n  (rst_n),
+      .go     (tb_seq_go),
+      .tx_busy(tx_busy),
+      .start  (seq_start)
+  );
+
+  // Transmitter BIST: once cocotb sets tb_bist_en it takes over ui_in[3:0]
+  // and the TX start bit, runs the whole sweep and raises bist_done:
+  reg        tb_bist_en;
+  wire [3:0] bist_data;
+  wire       bist_go;
+  wire       bist_done;
+  wire [7:0] bist_fail_count;
+
+  initial tb_bist_en = 1'b0;
+
+  tb_bist bist (
+      .clk       (clk),
+      .rst_n     (rst_n),
+      .en        (tb_bist_en),
+      .tx        (uo_out[0]),
+      .tx_busy   (tx_busy),
+      .bit_strobe(tx_bit_strobe),
+      .data      (bist_data),
+      .go        (bist_go),
+      .done      (bist_done),
+      .fail_count(bist_fail_count)
+  );
+
+  wire [3:0] dut_ui_lo = tb_bist_en ? bist_data
+                                    : {ui_in[3:1], tb_uart_busy ? tb_uart_tx : ui_in[0]};
+  wire [7:0] dut_ui_in = {ui_in[7:5], ui_in[4] | seq_start | bist_go, dut_ui_lo};
+
   // Replace tt_um_example with your module name:
   tt_um_ultrasword_jonz9 user_project (
-      .ui_in  (ui_in),    // Dedicated inputs
+      .ui_in  (dut_ui_in),  // Dedicated inputs
       .uo_out (uo_out),   // Dedicated outputs
       .uio_in (uio_in),   // IOs: Input path
       .uio_out(uio_out),  // IOs: Output path
@@ -0,0 +1,142 @@
+`default_nettype none
+
+/**
+ * Testbench Transmitter BIST
+ * Runs the whole transmitter sweep in HDL: every case is a start pulse, a
+ * 10-bit frame capture on the TX bit strobe and a compare against the expected
+ * frame. Known project.v issue: the DUT sends the codeword loaded LAG starts
+ * earlier (0 for the first LAG after reset), so the expected frames model that
+ * lag and LAG extra cases wrap round to data 0, 1 and send out the codewords of
+ * data 14 and 15. cocotb only waits for done.
+ */
+module tb_bist #(
+    parameter LAG     = 2,      // TX_START_LAG in tb_utils.py (test_hamming_bist checks)
+    parameter CASES   = 16 + LAG,   // data values + wrap-round cases
+    parameter TIMEOUT = 31      // clock cycles from go to the first TX bit strobe
+) (
+    input  wire       clk,
+    input  wire       rst_n,
+    input  wire       en,          // run the sweep once after reset
+    input  wire       tx,          // DUT UART TX pin
+    input  wire       tx_busy,     // DUT transmitter busy
+    input  wire       bit_strobe,  // last cycle of every TX bit (tx_bit_clkdiv in tb.v)
+    output wire [3:0] data,        // DUT ui_in[3:0] while en
+    output reg        go,          // DUT TX start (1-cycle pulse)
+    output reg        done,        // all cases finished
+    output reg  [7:0] fail_count   // cases that timed out or sent a wrong frame
+);
+    localparam IDLE    = 3'd0,
+               START   = 3'd1,
+               WAIT    = 3'd2,
+               CAPTURE = 3'd3,
+               CHECK   = 3'd4,
+               DRAIN   = 3'd5,
+               NEXT    = 3'd6,
+               FINISH  = 3'd7;
+
+    reg [2:0] state;
+    reg [5:0] case_count;           // current case (data = low 4 bits)
+    reg [4:0] wait_count;           // cycles waited for the first strobe
+    reg [3:0] bit_count;            // frame bits captured
+    reg [9:0] frame;                // captured frame, LSB = start bit
+
+    assign data = case_count[3:0];
+
+    // Codeword ROM: the 7-bit codeword the DUT sends for each ui_in[3:0]
+    // value (TX_CODE_INT in tb_utils.py)
+    function [6:0] code_rom(input [3:0] d);
+        case (d)
+            4'd0:   code_rom = 7'b0000000;
+            4'd1:   code_rom = 7'b1110000;
+            4'd2:   code_rom = 7'b1001100;
+            4'd3:   code_rom = 7'b0111100;
+            4'd4:   code_rom = 7'b0101010;
+            4'd5:   code_rom = 7'b1011010;
+            4'd6:   code_rom = 7'b1100110;
+            4'd7:   code_rom = 7'b0010110;
+            4'd8:   code_rom = 7'b1101001;
+            4'd9:   code_rom = 7'b0011001;
+            4'd10:  code_rom = 7'b0100101;
+            4'd11:  code_rom = 7'b1010101;
+            4'd12:  code_rom = 7'b1000011;
+            4'd13:  code_rom = 7'b0110011;
+            4'd14:  code_rom = 7'b0001111;
+            4'd15:  code_rom = 7'b1111111;
+        endcase
+    endfunction
+
+    // Codeword in the current case's frame: data loaded LAG cases back
+    wire [3:0] sent_data = case_count[3:0] - LAG;
+    wire [6:0] expected  = (case_count < LAG) ? 7'd0 : code_rom(sent_data);
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            state      <= IDLE;
+            case_count <= 6'd0;
+            wait_count <= 5'd0;
+            bit_count  <= 4'd0;
+            frame      <= 10'd0;
+            go         <= 1'b0;
+            done       <= 1'b0;
+            fail_count <= 8'd0;
+        end else begin
+            go <= 1'b0;
+
+            case (state)
+                IDLE: if (en) state <= START;
+
+                START: begin
+                    go         <= 1'b1;
+                    wait_count <= 5'd0;
+                    bit_count  <= 4'd0;
+                    state      <= WAIT;
+                end
+
+                // First strobe samples the start bit; give up after TIMEOUT cycles
+                WAIT: begin
+                    if (bit_strobe) begin
+                        frame     <= {tx, frame[9:1]};
+                        bit_count <= 4'd1;
+                        state     <= CAPTURE;
+                    end else if (wait_count == TIMEOUT) begin
+                        fail_count <= fail_count + 1'b1;
+                        state      <= DRAIN;
+                    end else begin
+                        wait_count <= wait_count + 1'b1;
+                    end
+                end
+
+                CAPTURE: begin
+                    if (bit_strobe) begin
+                        frame     <= {tx, frame[9:1]};
+                        bit_count <= bit_count + 1'b1;
+                        if (bit_count == 4'd9)
+                            state <= CHECK;
+                    end
+                end
+
+                // Stop bit high, pad bit (tx_data[7]) low, codeword, start bit low
+                CHECK: begin
+                    if (frame != {1'b1, 1'b0, expected, 1'b0})
+                        fail_count <= fail_count + 1'b1;
+                    state <= DRAIN;
+                end
+
+                DRAIN: if (!tx_busy) state <= NEXT;
+
+                NEXT: begin
+                    if (case_count == CASES - 1) begin
+                        done  <= 1'b1;
+                        state <= FINISH;
+                    end else begin
+                        case_count <= case_count + 1'b1;
+                        state      <= START;
+                    end
+                end
+
+                FINISH: ;
+            endcase
+        end
+    end
+
+endmodule
@@ -0,0 +1,28 @@
+`default_nettype none
+
+// Divide-by-N strobe ~ one pulse per UART bit period
+module tb_clkdiv #(
+    parameter N = 8            // clock cycles per UART bit (BAUD_CYCLES in tb_utils.py)
+) (
+    input  wire clk,           // clock
+    input  wire rst_n,         // reset_n - low to reset
+    output reg  bit_strobe     // high for one cycle every N clocks
+);
+
+    reg [7:0] cnt;             // cycle counter within the current bit
+
+    // Strobe logic
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            cnt        <= 8'd0;
+            bit_strobe <= 1'b0;
+        end else if (cnt == N - 1) begin
+            cnt        <= 8'd0;
+            bit_strobe <= 1'b1; // end of bit period
+        end else begin
+            cnt        <= cnt + 1;
+            bit_strobe <= 1'b0;
+        end
+    end
+
+endmodule
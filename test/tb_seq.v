@@ -0,0 +1,37 @@
+`default_nettype none
+
+/**
+ * Testbench TX Start Sequencer
+ * Every toggle of go waits for the DUT transmitter to go idle and then pulses
+ * start for one cycle, so a transmitter case needs a single write from cocotb
+ * and no reset or clock wait in between cases.
+ */
+module tb_seq (
+    input  wire clk,
+    input  wire rst_n,
+    input  wire go,             // toggle to run the sequence
+    input  wire tx_busy,        // DUT transmitter busy
+    output reg  start           // DUT TX start (1-cycle pulse)
+);
+    reg go_q;                   // go at the previous edge
+    reg pending;                // go seen, waiting for the transmitter to go idle
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            go_q    <= go;
+            pending <= 1'b0;
+            start   <= 1'b0;
+        end else begin
+            go_q  <= go;
+            start <= 1'b0;
+
+            if (go != go_q) begin
+                pending <= 1'b1;
+            end else if (pending && !tx_busy) begin
+                pending <= 1'b0;
+                start   <= 1'b1;
+            end
+        end
+    end
+
+endmodule
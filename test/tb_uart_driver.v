@@ -0,0 +1,59 @@
+`default_nettype none
+
+/**
+ * Testbench UART Driver
+ * Shifts a whole preloaded UART frame out LSB first, N clock cycles per bit,
+ * so the cocotb test only needs one load and one wait per frame.
+ */
+module tb_uart_driver #(
+    parameter N          = 8,   // clock cycles per UART bit (BAUD_CYCLES in tb_utils.py)
+    parameter FRAME_BITS = 11   // bits shifted out per load (idle, start, 7 data, stop, idle)
+) (
+    input  wire        clk,
+    input  wire        rst_n,
+    input  wire        load,        // load frame and start shifting (1-cycle pulse)
+    input  wire [15:0] load_data,   // frame bits, LSB sent first
+    output wire        tx,          // UART serial output (idle high)
+    output reg         busy,        // frame in progress
+    output reg         frame_done   // high for one cycle after the last bit
+);
+    reg [15:0] shift_reg;           // remaining frame bits
+    reg [3:0]  bit_count;           // counts bits in frame (0 to FRAME_BITS-1)
+    reg [7:0]  clk_count;           // counts 0 to N-1 within a bit
+
+    assign tx = busy ? shift_reg[0] : 1'b1;
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            shift_reg  <= 16'hFFFF;
+            bit_count  <= 4'd0;
+            clk_count  <= 8'd0;
+            busy       <= 1'b0;
+            frame_done <= 1'b0;
+        end else begin
+            frame_done <= 1'b0;
+
+            if (load && !busy) begin
+                // Latch the frame, first bit goes out immediately
+                shift_reg <= load_data;
+                bit_count <= 4'd0;
+                clk_count <= 8'd0;
+                busy      <= 1'b1;
+            end else if (busy) begin
+                if (clk_count == N - 1) begin
+                    clk_count <= 8'd0;
+                    shift_reg <= {1'b1, shift_reg[15:1]}; // shift right, fill with idle
+                    if (bit_count == FRAME_BITS - 1) begin
+                        busy       <= 1'b0;
+                        frame_done <= 1'b1;
+                    end else begin
+                        bit_count <= bit_count + 1'b1;
+                    end
+                end else begin
+                    clk_count <= clk_count + 1'b1;
+                end
+            end
+        end
+    end
+
+endmodule
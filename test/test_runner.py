@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: © 2024 Tiny Tapeout
+# SPDX-License-Identifier: Apache-2.0
+
+"""pytest entry point that runs each cocotb test in its own simulator.
+
+Run all tests in parallel (one simulator process per pytest-xdist worker):
+
+    pytest -n auto test_runner.py
+"""
+
+import importlib
+import os
+from pathlib import Path
+
+import cocotb
+import pytest
+from cocotb.runner import get_runner
+
+import tb_utils
+
+TEST_DIR = Path(__file__).resolve().parent
+SRC_DIR = TEST_DIR.parent / "src"
+
+# Testbench wrapper and its HDL-side helpers (same list as the Makefile)
+TB_SOURCES = ["tb.v", "tb_clkdiv.v", "tb_uart_driver.v", "tb_bist.v",
+              "tb_seq.v"]
+
+# Same Verilator optimisation flags as the Makefile
+VERILATOR_ARGS = ["--x-assign", "fast", "--x-initial", "fast", "-Wno-fatal", "--timing",
+                  "-O3", "--noassert", "-CFLAGS", "-O3"]
+
+# cocotb test modules; every @cocotb.test() in them is simulated independently
+TEST_MODULES = ["test_transmitter", "test_receiver"]
+
+
+def cocotb_tests(test_module):
+    """(name, skip, sharded) for the @cocotb.test() coroutines in a test module.
+
+    Importing the module outside a simulator only defines its tests, so skip
+    is each cocotb.test object's own flag (e.g. under TX_BIST); sharded tests
+    sweep shard_data_values() and run once per TEST_SHARD.
+    """
+    module = importlib.import_module(test_module)
+    return [
+        (test.name, test.skip, "shard_data_values" in test.__wrapped__.__code__.co_names)
+        for test in vars(module).values()
+        if isinstance(test, cocotb.test)
+    ]
+
+
+def clock_plusargs():
+    """tb.v clock plusargs matching the Makefile's COCOTB_HDL_CLOCK/COCOTB_CLOCK_PERIOD handling."""
+    plusargs = [f"+CLOCK_PERIOD={os.getenv('COCOTB_CLOCK_PERIOD', '50')}"]
+    if os.getenv("COCOTB_HDL_CLOCK", "1") == "0":
+        plusargs.append("+NO_HDL_CLOCK")
+    return plusargs
+
+
+# One case per test and shard; tests skipped under the current TX_BIST are
+# reported as skipped here instead of building a simulator just to skip them
+TEST_CASES = [
+    pytest.param(
+        module, case, shard,
+        id=f"{module}.{case}" + ("" if shard is None else f".shard{shard}"),
+        marks=pytest.mark.skip(reason="skip= set on the cocotb test (TX_BIST)") if skip else (),
+    )
+    for module in TEST_MODULES
+    for case, skip, sharded in cocotb_tests(module)
+    for shard in (range(tb_utils.TEST_SHARDS) if sharded else (None,))
+]
+
+
+@pytest.mark.parametrize("test_module,testcase,shard", TEST_CASES)
+def test_cocotb(test_module, testcase, shard):
+    """Build the design into a per-test directory and run one cocotb test (or shard) there."""
+    build_dir = TEST_DIR / "sim_build" / f"{test_module}.{testcase}"
+    extra_env = {"COCOTB_RESOLVE_X": os.getenv("COCOTB_RESOLVE_X", "ZEROS")}  # as in the Makefile
+    if shard is not None:
+        build_dir = build_dir.with_name(f"{build_dir.name}.shard{shard}")
+        extra_env["TEST_SHARD"] = str(shard)
+    sim = os.getenv("SIM", "icarus")
+    runner = get_runner(sim)
+    runner.build(
+        verilog_sources=sorted(SRC_DIR.glob("*.v")) + [TEST_DIR / f for f in TB_SOURCES],
+        includes=[SRC_DIR],
+        hdl_toplevel="tb",
+        build_args=VERILATOR_ARGS if sim == "verilator" else [],
+        build_dir=build_dir,
+    )
+    runner.test(
+        test_module=test_module,
+        testcase=testcase,
+        hdl_toplevel="tb",
+        build_dir=build_dir,
+        test_dir=build_dir,  # keeps each run's tb.vcd and results apart
+        plusargs=clock_plusargs(),
+        extra_env=extra_env,
+    )